@@ -1,14 +1,16 @@
+import argparse
 import logging
 import sys
+from operator import itemgetter
 from pathlib import Path
 
-import defopt
-
-import primaschema.lib as lib
+from primaschema import __version__
 
 
 logging.basicConfig(format="%(levelname)s: %(message)s", level=logging.INFO)
 
+_interval_key = itemgetter(0, 1)
+
 
 def hash_bed(bed_path: Path):
     """
@@ -16,9 +18,11 @@ def hash_bed(bed_path: Path):
 
     :arg ref_path: Path of bed file
     """
+    import primaschema.lib as lib
+
     hex_digest = lib.hash_bed(bed_path)
-    print("BED checksum:", file=sys.stderr)
-    print(hex_digest)
+    sys.stderr.write("BED checksum:\n")
+    sys.stdout.write(hex_digest + "\n")
 
 
 def hash_ref(ref_path: Path):
@@ -27,9 +31,11 @@ def hash_ref(ref_path: Path):
 
     :arg ref_path: Path of reference sequence
     """
+    import primaschema.lib as lib
+
     hex_digest = lib.hash_ref(ref_path)
-    print("Reference checksum:", file=sys.stderr)
-    print(hex_digest)
+    sys.stderr.write("Reference checksum:\n")
+    sys.stdout.write(hex_digest + "\n")
 
 
 def validate(scheme_dir: Path, full: bool = False):
@@ -41,6 +47,8 @@ def validate(scheme_dir: Path, full: bool = False):
     :arg force: Overwrite existing output files
     :arg full: Perform meticulous validation using full model
     """
+    import primaschema.lib as lib
+
     return lib.validate(scheme_dir, full=full)
 
 
@@ -52,6 +60,8 @@ def validate_recursive(root_dir: Path, full: bool = False, force: bool = False):
     :arg full: Perform meticulous validation using full model
     :arg force: Overwrite existing schemes and ignore hash check failures
     """
+    import primaschema.lib as lib
+
     lib.validate_recursive(root_dir=root_dir, full=full, force=force)
 
 
@@ -66,6 +76,8 @@ def build(
     :arg full: Perform meticulous validation using full model
     :arg force: Overwrite existing output files
     """
+    import primaschema.lib as lib
+
     lib.build(scheme_dir=scheme_dir, out_dir=out_dir, full=full, force=force)
 
 
@@ -80,6 +92,8 @@ def build_recursive(
     :arg force: Overwrite existing schemes and ignore hash check failures
     :arg nested: Build definitions inside a nested dir structure of family/version
     """
+    import primaschema.lib as lib
+
     lib.build_recursive(root_dir=root_dir, full=full, force=force, nested=nested)
 
 
@@ -91,6 +105,8 @@ def build_manifest(root_dir: Path, schema_dir: Path = Path(), out_dir: Path = Pa
     :arg schema_dir: Path of schema directory
     :arg out_dir: Path of directory in which to save manifest
     """
+    import primaschema.lib as lib
+
     lib.build_manifest(root_dir=root_dir, schema_dir=schema_dir, out_dir=out_dir)
 
 
@@ -101,6 +117,8 @@ def seven_to_six(bed_path: Path, out_dir: Path = Path()):
     :arg bed_path: Path of primer.bed file
     :arg out_dir: Path of directory in which to save primer.bed
     """
+    import primaschema.lib as lib
+
     lib.convert_primer_bed_to_scheme_bed(bed_path=bed_path, out_dir=out_dir)
 
 
@@ -112,6 +130,8 @@ def six_to_seven(bed_path: Path, fasta_path: Path, out_dir: Path = Path()):
     :arg fasta_path: Path of reference sequence
     :arg out_dir: Path of directory in which to save primer.bed
     """
+    import primaschema.lib as lib
+
     lib.convert_scheme_bed_to_primer_bed(
         bed_path=bed_path, fasta_path=fasta_path, out_dir=out_dir
     )
@@ -125,9 +145,11 @@ def diff(bed1_path: Path, bed2_path: Path, only_positions: bool = False):
     :arg bed_path2: Path of second bed file
     :arg only_positions: Use only primer positions when computing differences
     """
+    import primaschema.lib as lib
+
     df = lib.diff(bed1_path, bed2_path, only_positions)
     if not df.empty:
-        print(df.to_string(index=False))
+        df.to_csv(sys.stdout, sep="\t", index=False)
 
 
 def show_non_ref_alts(scheme_dir: Path):
@@ -136,7 +158,11 @@ def show_non_ref_alts(scheme_dir: Path):
 
     :arg scheme_dir: Path of input scheme directory
     """
-    print(lib.show_non_ref_alts(scheme_dir=scheme_dir))
+    import primaschema.lib as lib
+
+    df = lib.show_non_ref_alts(scheme_dir=scheme_dir)
+    if not df.empty:
+        df.to_csv(sys.stdout, sep="\t", index=False)
 
 
 def print_intervals(bed_path: Path):
@@ -145,35 +171,129 @@ def print_intervals(bed_path: Path):
 
     :arg ref_path: Path of bed file
     """
+    import primaschema.lib as lib
+
     all_intervals = lib.compute_intervals(bed_path)
     sorted_by_chrom = sorted(all_intervals.items())
+    lines = []
     for chrom, intervals in sorted_by_chrom:
-        sorted_interval_keys = sorted(intervals, key=lambda x: (x[0], x[1]))
+        sorted_interval_keys = sorted(intervals, key=_interval_key)
         for name in sorted_interval_keys:
             interval = intervals[name]
-            print(f"{chrom}\t{interval[0]}\t{interval[1]}\t{name}")
+            lines.append(f"{chrom}\t{interval[0]}\t{interval[1]}\t{name}")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
-def main():
-    defopt.run(
-        {
-            "hash-ref": hash_ref,
-            "hash-bed": hash_bed,
-            "validate": validate,
-            "validate-recursive": validate_recursive,
-            "build": build,
-            "build-recursive": build_recursive,
-            "build-manifest": build_manifest,
-            "diff": diff,
-            "6to7": six_to_seven,
-            "7to6": seven_to_six,
-            "show-non-ref-alts": show_non_ref_alts,
-            "intervals": print_intervals,
-        },
-        no_negated_flags=True,
-        strict_kwonly=False,
-        short={},
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once, avoiding per-invocation reflection"""
+    parser = argparse.ArgumentParser(prog="primaschema")
+    parser.add_argument("--version", action="version", version=__version__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    p = subparsers.add_parser("hash-ref", help="Generate reference sequence checksum")
+    p.add_argument("ref_path", type=Path)
+    p.set_defaults(func=hash_ref)
+
+    p = subparsers.add_parser("hash-bed", help="Generate a bed file checksum")
+    p.add_argument("bed_path", type=Path)
+    p.set_defaults(func=hash_bed)
+
+    p = subparsers.add_parser(
+        "validate",
+        help="Validate a primer scheme bundle containing info.yml, primer.bed and reference.fasta",
     )
+    p.add_argument("scheme_dir", type=Path)
+    p.add_argument("--full", action="store_true")
+    p.set_defaults(func=validate)
+
+    p = subparsers.add_parser(
+        "validate-recursive",
+        help="Recursively validate primer scheme bundles in the specified directory",
+    )
+    p.add_argument("root_dir", type=Path)
+    p.add_argument("--full", action="store_true")
+    p.add_argument("--force", action="store_true")
+    p.set_defaults(func=validate_recursive)
+
+    p = subparsers.add_parser(
+        "build",
+        help="Build a primer scheme bundle containing info.yml, primer.bed and reference.fasta",
+    )
+    p.add_argument("scheme_dir", type=Path)
+    p.add_argument("--out-dir", type=Path, default=Path())
+    p.add_argument("--full", action="store_true")
+    p.add_argument("--force", action="store_true")
+    p.set_defaults(func=build)
+
+    p = subparsers.add_parser(
+        "build-recursive",
+        help="Recursively build primer scheme bundles in the specified directory",
+    )
+    p.add_argument("root_dir", type=Path)
+    p.add_argument("--full", action="store_true")
+    p.add_argument("--force", action="store_true")
+    p.add_argument("--nested", action="store_true")
+    p.set_defaults(func=build_recursive)
+
+    p = subparsers.add_parser(
+        "build-manifest",
+        help="Build a complete manifest of schemes contained in the specified directory",
+    )
+    p.add_argument("root_dir", type=Path)
+    p.add_argument("--schema-dir", type=Path, default=Path())
+    p.add_argument("--out-dir", type=Path, default=Path())
+    p.set_defaults(func=build_manifest)
+
+    p = subparsers.add_parser(
+        "diff", help="Show the symmetric difference of records in two bed files"
+    )
+    p.add_argument("bed1_path", type=Path)
+    p.add_argument("bed2_path", type=Path)
+    p.add_argument("--only-positions", action="store_true")
+    p.set_defaults(func=diff)
+
+    p = subparsers.add_parser(
+        "6to7",
+        help="Convert a 6 column scheme.bed file to a 7 column primer.bed file using a reference sequence",
+    )
+    p.add_argument("bed_path", type=Path)
+    p.add_argument("fasta_path", type=Path)
+    p.add_argument("--out-dir", type=Path, default=Path())
+    p.set_defaults(func=six_to_seven)
+
+    p = subparsers.add_parser(
+        "7to6",
+        help="Convert a 7 column primer.bed file to a 6 column scheme.bed file by dropping a column",
+    )
+    p.add_argument("bed_path", type=Path)
+    p.add_argument("--out-dir", type=Path, default=Path())
+    p.set_defaults(func=seven_to_six)
+
+    p = subparsers.add_parser(
+        "show-non-ref-alts",
+        help="Show primer records with sequences not matching the reference sequence",
+    )
+    p.add_argument("scheme_dir", type=Path)
+    p.set_defaults(func=show_non_ref_alts)
+
+    p = subparsers.add_parser(
+        "intervals", help="Show intervals covered by primers in a BED file"
+    )
+    p.add_argument("bed_path", type=Path)
+    p.set_defaults(func=print_intervals)
+
+    return parser
+
+
+_PARSER = build_parser()
+
+
+def main():
+    args = vars(_PARSER.parse_args())
+    args.pop("command")
+    func = args.pop("func")
+    func(**args)
 
 
 if __name__ == "__main__":
@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+import copy
+import functools
 import hashlib
 import importlib.util
 import json
@@ -6,35 +10,46 @@ import os
 import re
 import shutil
 import sys
+import threading
 from collections import defaultdict
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Literal
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Literal
 
 import jsonschema
-import pandas as pd
 import yaml
-from Bio import SeqIO
-
-# from linkml.generators.pydanticgen import PydanticGenerator
-from linkml.generators.pythongen import PythonGenerator
-from linkml_runtime.utils.schemaview import SchemaView
 
 from primaschema.util import run
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 SCHEME_BED_FIELDS = ["chrom", "chromStart", "chromEnd", "name", "poolName", "strand"]
 PRIMER_BED_FIELDS = SCHEME_BED_FIELDS + ["sequence"]
 POSITION_FIELDS = ["chromStart", "chromEnd"]
 
+IO_BUF = 1 << 17  # 128 KiB; the 8 KiB default is small for bulk sequence reads
+
+_pythonise_lock = threading.Lock()
+
+# IUPAC nucleotide complement table, matching Bio.Seq.reverse_complement
+_COMPLEMENT = bytes.maketrans(
+    b"ACGTURYSWKMBVDHNacgturyswkmbvdhn",
+    b"TGCAAYRSWMKVBHDNtgcaayrswmkvbhdn",
+)
 
-def scan(path):
-    """Recursively yield DirEntry objects"""
-    for entry in os.scandir(path):
-        if entry.is_dir(follow_symlinks=False):
-            yield from scan(entry.path)
-        else:
-            yield entry
+
+# Directories never containing scheme definitions; pruned during tree walks
+_SKIP_DIRS = {".git", "built", "__pycache__"}
+
+
+def find_files(root_dir: Path, name: str):
+    """Yield paths of files with the given name under root_dir, pruning _SKIP_DIRS"""
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+        if name in filenames:
+            yield Path(dirpath) / name
 
 
 def import_class_from_path(file_path, class_name="PrimerScheme"):
@@ -71,39 +86,52 @@ def hash_string(string: str) -> str:
 
 def parse_scheme_bed(bed_path: Path) -> pd.DataFrame:
     """Parse a 6 column scheme.bed bed file"""
+    import pandas as pd
+
     return pd.read_csv(
         bed_path,
         sep="\t",
         names=SCHEME_BED_FIELDS,
         dtype=dict(
-            chrom=str,
+            chrom="category",
             chromStart=int,
             chromEnd=int,
             name=str,
             poolName=int,
-            strand=str,
+            strand="category",
         ),
     )
 
 
-def parse_primer_bed(bed_path: Path) -> pd.DataFrame:
-    """Parse a 7 column primer.bed bed file"""
+@functools.lru_cache(maxsize=64)
+def _parse_primer_bed_cached(bed_path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    import pandas as pd
+
     return pd.read_csv(
         bed_path,
         sep="\t",
         names=PRIMER_BED_FIELDS,
         dtype=dict(
-            chrom=str,
+            chrom="category",
             chromStart=int,
             chromEnd=int,
             name=str,
             poolName=int,
-            strand=str,
+            strand="category",
             sequence=str,
         ),
     )
 
 
+def parse_primer_bed(bed_path: Path) -> pd.DataFrame:
+    """Parse a 7 column primer.bed bed file, memoised on file identity"""
+    stat = os.stat(bed_path)
+    # Copy so that callers mutating the frame cannot poison the cache
+    return _parse_primer_bed_cached(
+        os.fspath(bed_path), stat.st_mtime_ns, stat.st_size
+    ).copy()
+
+
 def normalise_primer_bed_df(df: pd.DataFrame) -> pd.DataFrame:
     """
     - Removes terminal whitespace
@@ -112,10 +140,13 @@ def normalise_primer_bed_df(df: pd.DataFrame) -> pd.DataFrame:
     - Removes duplicate records, collapsing alts with same coords if backfilled from ref
     """
     df["sequence"] = df["sequence"].str.strip().str.upper()
-    df = df.sort_values(
-        ["chromStart", "chromEnd", "poolName", "strand", "sequence"]
-    ).drop_duplicates()
-    return df
+    starts = df["chromStart"]
+    # Strictly increasing chromStart means the composite sort is a no-op
+    if not (starts.is_monotonic_increasing and starts.is_unique):
+        df = df.sort_values(
+            ["chromStart", "chromEnd", "poolName", "strand", "sequence"]
+        )
+    return df.drop_duplicates()
 
 
 def hash_primer_bed_df(df: pd.DataFrame) -> str:
@@ -134,24 +165,47 @@ def hash_primer_bed(bed_path: Path):
     return hash_primer_bed_df(df)
 
 
+def read_fasta_bytes(fasta_path: Path) -> bytes:
+    """Read a single-record FASTA sequence as contiguous bytes"""
+    chunks = []
+    in_record = False
+    with open(fasta_path, "rb", buffering=IO_BUF) as fh:
+        for line in fh:
+            if line.startswith(b">"):
+                if in_record:
+                    raise ValueError(f"More than one record found in {fasta_path}")
+                in_record = True
+                continue
+            if in_record:
+                chunks.append(line.strip())
+    if not in_record:
+        raise ValueError(f"No records found in {fasta_path}")
+    return b"".join(chunks)
+
+
 def hash_scheme_bed(bed_path: Path, fasta_path: Path) -> str:
     """
     Hash a 6 column scheme.bed file by first converting to 7 column primer.bed
     """
     logging.info("Hashing scheme.bed using reference backfill")
-    ref_record = SeqIO.read(fasta_path, "fasta")
+    ref_seq = read_fasta_bytes(fasta_path)
     df = parse_scheme_bed(bed_path)
-    records = df.to_dict("records")
-    for r in records:
-        start_pos, end_pos = r["chromStart"], r["chromEnd"]
-        if r["strand"] == "+":
-            r["sequence"] = str(ref_record.seq[start_pos:end_pos])
-        elif r["strand"] == "-":
-            r["sequence"] = str(ref_record.seq[start_pos:end_pos].reverse_complement())
-        else:
-            raise RuntimeError(f"Invalid strand for BED record {r}")
-    bed7_df = pd.DataFrame(records)
-    return hash_primer_bed_df(bed7_df)
+    invalid_strands = df.loc[~df["strand"].isin(("+", "-"))]
+    if not invalid_strands.empty:
+        raise RuntimeError(
+            f"Invalid strand for BED records {invalid_strands.to_dict('records')}"
+        )
+    df["sequence"] = [
+        ref_seq[s:e].decode()
+        if fwd
+        else ref_seq[s:e].translate(_COMPLEMENT)[::-1].decode()
+        for s, e, fwd in zip(
+            df["chromStart"].to_numpy(),
+            df["chromEnd"].to_numpy(),
+            (df["strand"] == "+").to_numpy(),
+        )
+    ]
+    return hash_primer_bed_df(df)
 
 
 def convert_primer_bed_to_scheme_bed(bed_path: Path, out_dir: Path = Path()):
@@ -159,23 +213,33 @@ def convert_primer_bed_to_scheme_bed(bed_path: Path, out_dir: Path = Path()):
     df.to_csv(Path(out_dir) / "scheme.bed", sep="\t", header=False, index=False)
 
 
+def scheme_to_primer_df(bed_path: Path, fasta_path: Path) -> pd.DataFrame:
+    """Backfill primer sequences from the reference, returning a 7 column dataframe"""
+    ref_seq = read_fasta_bytes(fasta_path)
+    df = parse_scheme_bed(bed_path)
+    df["sequence"] = [
+        ref_seq[s:e].decode()
+        if fwd
+        else ref_seq[s:e].translate(_COMPLEMENT)[::-1].decode()
+        for s, e, fwd in zip(
+            df["chromStart"].to_numpy(),
+            df["chromEnd"].to_numpy(),
+            (df["strand"] == "+").to_numpy(),
+        )
+    ]
+    return df
+
+
 def convert_scheme_bed_to_primer_bed(
     bed_path: Path, fasta_path: Path, out_dir: Path = Path()
 ):
-    ref_record = SeqIO.read(fasta_path, "fasta")
-    df = parse_scheme_bed(bed_path)
-    records = df.to_dict("records")
-    for r in records:
-        start_pos, end_pos = r["chromStart"], r["chromEnd"]
-        if r["strand"] == "+":
-            r["sequence"] = str(ref_record.seq[start_pos:end_pos])
-        else:
-            r["sequence"] = str(ref_record.seq[start_pos:end_pos].reverse_complement())
-    df = pd.DataFrame(records)
+    df = scheme_to_primer_df(bed_path=bed_path, fasta_path=fasta_path)
     df.to_csv(Path(out_dir) / "primer.bed", sep="\t", header=False, index=False)
 
 
-def hash_bed(bed_path: Path) -> str:
+@functools.lru_cache(maxsize=1024)
+def _hash_bed_cached(bed_path: str, bed_key: tuple, ref_key: tuple | None) -> str:
+    bed_path = Path(bed_path)
     bed_type = infer_bed_type(bed_path)
     if bed_type == "primer":
         checksum = hash_primer_bed(bed_path)
@@ -186,20 +250,71 @@ def hash_bed(bed_path: Path) -> str:
     return checksum
 
 
+def hash_bed(bed_path: Path) -> str:
+    """Hash a bed file, memoised on file identity across validate and build"""
+    bed_path = Path(bed_path)
+    stat = os.stat(bed_path)
+    ref_path = bed_path.parent / "reference.fasta"
+    # Scheme bed digests also depend on the sibling reference, so key on both
+    ref_key = None
+    if ref_path.exists():
+        ref_stat = os.stat(ref_path)
+        ref_key = (ref_stat.st_mtime_ns, ref_stat.st_size)
+    return _hash_bed_cached(
+        os.fspath(bed_path), (stat.st_mtime_ns, stat.st_size), ref_key
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _hash_ref_cached(ref_path: str, mtime_ns: int, size: int) -> str:
+    # Stream the sequence into the hasher line by line rather than
+    # materialising it; normalisation matches hash_string
+    hasher = hashlib.sha256()
+    in_record = False
+    with open(ref_path, "rb", buffering=IO_BUF) as fh:
+        for line in fh:
+            if line.startswith(b">"):
+                if in_record:
+                    raise ValueError(f"More than one record found in {ref_path}")
+                in_record = True
+                continue
+            if in_record:
+                hasher.update(line.strip().upper())
+    if not in_record:
+        raise ValueError(f"No records found in {ref_path}")
+    return f"primaschema:{hasher.hexdigest()[:16]}"
+
+
 def hash_ref(ref_path: Path):
-    record = SeqIO.read(ref_path, "fasta")
-    return hash_string(record.seq)
+    """Hash a reference sequence, memoised on file identity"""
+    stat = os.stat(ref_path)
+    return _hash_ref_cached(os.fspath(ref_path), stat.st_mtime_ns, stat.st_size)
 
 
 def count_tsv_columns(bed_path: Path) -> int:
-    return len(pd.read_csv(bed_path, sep="\t").columns)
+    """Count columns from the first non-empty line rather than parsing the file"""
+    with open(bed_path) as fh:
+        for line in fh:
+            line = line.rstrip("\n")
+            if line:
+                return line.count("\t") + 1
+    return 0
 
 
-def parse_yaml(path) -> dict:
+@functools.lru_cache(maxsize=256)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> dict:
     with open(path, "r") as fh:
         return yaml.safe_load(fh)
 
 
+def parse_yaml(path) -> dict:
+    """Parse a YAML file, memoised on (path, mtime, size) across calls"""
+    stat = os.stat(path)
+    data = _parse_yaml_cached(os.fspath(path), stat.st_mtime_ns, stat.st_size)
+    # Copy so callers mutating the result cannot poison the cache
+    return copy.deepcopy(data)
+
+
 def validate_yaml_with_json_schema(yaml_path: Path, schema_path: Path):
     yaml_data = parse_yaml(yaml_path)
     with open(schema_path, "r") as schema_fh:
@@ -207,21 +322,38 @@ def validate_yaml_with_json_schema(yaml_path: Path, schema_path: Path):
     return jsonschema.validate(yaml_data, schema=schema)
 
 
+@functools.lru_cache(maxsize=None)
+def _compile_linkml_schema(schema_path: str):
+    """Compile the linkml schema module once per schema path"""
+    # Deferred since linkml imports are slow and only validation needs them
+    from linkml.generators.pythongen import PythonGenerator
+    from linkml_runtime.utils.schemaview import SchemaView
+
+    schema_view = SchemaView(schema_path)
+    return PythonGenerator(schema_view.schema).compile_module()
+
+
+@functools.lru_cache(maxsize=None)
+def _pythonised_schema_class(pythonised_schema_path: str, schema_path: str):
+    """Generate (if needed) and import the Pythonised schema class once per path"""
+    with _pythonise_lock:
+        if not Path(pythonised_schema_path).exists():
+            run(f"gen-python {schema_path} > {pythonised_schema_path}")
+            logging.info(f"Wrote Pythonised schema to {pythonised_schema_path}")
+    return import_class_from_path(pythonised_schema_path)
+
+
 def validate_with_linkml_schema(yaml_path: Path, full: bool = False):
     data = parse_yaml(yaml_path)
     schema_path = get_primer_schemes_path() / "schema/primer_scheme.yml"
     pythonised_schema_path = get_primer_schemes_path() / "schema/primer_scheme.py"
     if full:
-        schema_view = SchemaView(schema_path)
-        schema_gen = PythonGenerator(schema_view.schema)
-        schema_compiled = schema_gen.compile_module()
+        schema_compiled = _compile_linkml_schema(os.fspath(schema_path))
         schema_compiled.PrimerScheme(**data)  # Errors on validation failure
     else:
-        if not pythonised_schema_path.exists():
-            run(f"gen-python {schema_path} > {pythonised_schema_path}")
-            logging.info(f"Wrote Pythonised schema to {pythonised_schema_path}")
-            print(run("ls").stdout)
-        PrimerScheme = import_class_from_path(pythonised_schema_path)
+        PrimerScheme = _pythonised_schema_class(
+            os.fspath(pythonised_schema_path), os.fspath(schema_path)
+        )
         PrimerScheme(**data)  # Errors on validation failure
 
 
@@ -266,8 +398,12 @@ def validate(scheme_dir: Path, full: bool = False, force: bool = False):
     scheme = parse_yaml(scheme_dir / "info.yml")
     existing_primer_checksum = scheme.get("primer_checksum")
     existing_reference_checksum = scheme.get("reference_checksum")
-    primer_checksum = hash_bed(scheme_dir / "primer.bed")
-    reference_checksum = hash_ref(scheme_dir / "reference.fasta")
+    # Hash primer.bed and reference.fasta concurrently; hashlib releases the GIL
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        primer_future = executor.submit(hash_bed, scheme_dir / "primer.bed")
+        reference_future = executor.submit(hash_ref, scheme_dir / "reference.fasta")
+        primer_checksum = primer_future.result()
+        reference_checksum = reference_future.result()
     if (
         existing_primer_checksum
         and not primer_checksum == existing_primer_checksum
@@ -293,19 +429,39 @@ def validate(scheme_dir: Path, full: bool = False, force: bool = False):
             f"Calculated and documented reference checksums do not match ({reference_checksum} and {existing_reference_checksum})"
         )
     logging.info(f"Validation successful for {scheme.get('name')} ")
+    return {
+        "primer_checksum": primer_checksum,
+        "reference_checksum": reference_checksum,
+    }
+
+
+def find_scheme_dirs(root_dir: Path):
+    """Yield scheme directories (those containing info.yml) under root_dir"""
+    for info_path in find_files(root_dir, "info.yml"):
+        yield info_path.parent
+
+
+def _ensure_pythonised_schema():
+    """Generate the Pythonised schema up front so worker processes never race"""
+    schema_path = get_primer_schemes_path() / "schema/primer_scheme.yml"
+    pythonised_schema_path = get_primer_schemes_path() / "schema/primer_scheme.py"
+    with _pythonise_lock:
+        if not pythonised_schema_path.exists():
+            run(f"gen-python {schema_path} > {pythonised_schema_path}")
+            logging.info(f"Wrote Pythonised schema to {pythonised_schema_path}")
 
 
 def validate_recursive(root_dir: Path, full: bool = False, force: bool = False):
     """Validate all schemes in a directory tree"""
-    schemes_paths = {}
-    for entry in scan(root_dir):
-        if entry.is_file() and entry.name == "info.yml":
-            scheme_dir = Path(entry.path).parent
-            scheme = scheme_dir.name
-            schemes_paths[scheme] = scheme_dir
-
-    for scheme, path in schemes_paths.items():
-        validate(scheme_dir=path, full=full, force=force)
+    if not full:
+        _ensure_pythonised_schema()
+    with ProcessPoolExecutor() as executor:
+        futures = [
+            executor.submit(validate, scheme_dir=scheme_dir, full=full, force=force)
+            for scheme_dir in find_scheme_dirs(root_dir)
+        ]
+        for future in futures:
+            future.result()
 
 
 def build(
@@ -321,7 +477,7 @@ def build(
     primer.bed or reference.bed, generate a directory containing info.yml including
     primer and reference checksums and a canonical primer.bed representation.
     """
-    validate(scheme_dir=scheme_dir, full=full, force=force)
+    checksums = validate(scheme_dir=scheme_dir, full=full, force=force)
     scheme = parse_yaml(scheme_dir / "info.yml")
     if nested:
         family = Path(scheme["name"].partition("-")[0])
@@ -333,19 +489,19 @@ def build(
         out_dir.mkdir(parents=True, exist_ok=force)
     except FileExistsError:
         raise FileExistsError(f"Output directory {out_dir} already exists")
-    scheme["primer_checksum"] = hash_bed(scheme_dir / "primer.bed")
-    scheme["reference_checksum"] = hash_ref(scheme_dir / "reference.fasta")
-    with open(out_dir / "info.yml", "w") as scheme_fh:
-        logging.info(f"Writing info.yml to {out_dir}/info.yml")
-        yaml.dump(scheme, scheme_fh, sort_keys=False)
+    scheme.update(checksums)  # Reuse the digests validate() just computed
+    logging.info(f"Writing info.yml to {out_dir}/info.yml")
+    # Serialise in memory and write in one call
+    (out_dir / "info.yml").write_text(yaml.dump(scheme, sort_keys=False))
     logging.info(f"Copying primer.bed to {out_dir}/primer.bed")
     shutil.copy(scheme_dir / "primer.bed", out_dir)
     logging.info(f"Copying reference.fasta to {out_dir}/reference.fasta")
     shutil.copy(scheme_dir / "reference.fasta", out_dir)
     logging.info(f"Writing scheme.bed to {out_dir}/scheme.bed")
-    convert_primer_bed_to_scheme_bed(bed_path=out_dir / "primer.bed")
-    shutil.copy("scheme.bed", out_dir.resolve())
-    os.remove("scheme.bed")
+    # Convert from the source bed so the parse cache primed by validate() is hit
+    convert_primer_bed_to_scheme_bed(
+        bed_path=scheme_dir / "primer.bed", out_dir=out_dir
+    )
 
 
 def build_recursive(
@@ -353,13 +509,18 @@ def build_recursive(
 ):
     """Build all schemes in a directory tree"""
     schemes_paths = {}
-    for entry in scan(root_dir):
-        if entry.is_file() and entry.name == "info.yml":
-            scheme = parse_yaml(entry.path)
-            scheme_dir = Path(entry.path).parent
-            schemes_paths[scheme.get("name")] = scheme_dir
-    for scheme, path in schemes_paths.items():
-        build(scheme_dir=path, full=full, force=force)
+    for info_path in find_files(root_dir, "info.yml"):
+        scheme = parse_yaml(info_path)
+        schemes_paths[scheme.get("name")] = info_path.parent
+    if not full:
+        _ensure_pythonised_schema()
+    with ProcessPoolExecutor() as executor:
+        futures = [
+            executor.submit(build, scheme_dir=path, full=full, force=force)
+            for path in schemes_paths.values()
+        ]
+        for future in futures:
+            future.result()
 
 
 def build_manifest(root_dir: Path, schema_dir: Path, out_dir: Path = Path()):
@@ -377,13 +538,12 @@ def build_manifest(root_dir: Path, schema_dir: Path, out_dir: Path = Path()):
 
     names_schemes = {}
     families_names = defaultdict(list)
-    for entry in scan(root_dir):
-        if entry.is_file() and entry.name == "info.yml":
-            scheme = parse_yaml(entry.path)
-            name = scheme["name"]
-            names_schemes[name] = scheme
-            family, _, version = scheme["name"].partition("-")
-            families_names[family].append(name)
+    for info_path in find_files(root_dir, "info.yml"):
+        scheme = parse_yaml(info_path)
+        name = scheme["name"]
+        names_schemes[name] = scheme
+        family, _, version = scheme["name"].partition("-")
+        families_names[family].append(name)
 
     families_data = []
     for family, names in sorted(families_names.items()):
@@ -411,14 +571,30 @@ def build_manifest(root_dir: Path, schema_dir: Path, out_dir: Path = Path()):
     manifest["schemes"] = families_data
 
     manifest_file_name = "index.yml"
-    with open(out_dir / manifest_file_name, "w") as fh:
-        logging.info(f"Writing {manifest_file_name} to {out_dir}/{manifest_file_name}")
-        yaml.dump(data=manifest, stream=fh, sort_keys=False)
+    logging.info(f"Writing {manifest_file_name} to {out_dir}/{manifest_file_name}")
+    (Path(out_dir) / manifest_file_name).write_text(
+        yaml.dump(data=manifest, sort_keys=False)
+    )
     validate_yaml_with_json_schema(
         yaml_path=out_dir / manifest_file_name, schema_path=schema_path
     )
 
 
+def _diff_dfs(
+    df1: pd.DataFrame, df2: pd.DataFrame, column_subset: list[str]
+) -> pd.DataFrame:
+    """Symmetric difference of records on the given columns, preserving row order"""
+    import pandas as pd
+
+    # Compare int64 row hashes rather than concatenating the full frames;
+    # keys seen more than once across both frames match drop_duplicates(keep=False)
+    key1 = pd.util.hash_pandas_object(df1[column_subset], index=False)
+    key2 = pd.util.hash_pandas_object(df2[column_subset], index=False)
+    counts = pd.concat([key1, key2]).value_counts()
+    unique_keys = counts.index[counts == 1]
+    return pd.concat([df1[key1.isin(unique_keys)], df2[key2.isin(unique_keys)]])
+
+
 def diff(bed1_path: Path, bed2_path: Path, only_positions: bool = False):
     """Show symmetric differences between records in two primer.bed files"""
     df1 = parse_primer_bed(bed1_path).assign(origin="bed1")
@@ -427,42 +603,42 @@ def diff(bed1_path: Path, bed2_path: Path, only_positions: bool = False):
         column_subset = POSITION_FIELDS
     else:
         column_subset = PRIMER_BED_FIELDS
-    return pd.concat([df1, df2]).drop_duplicates(subset=column_subset, keep=False)
+    return _diff_dfs(df1, df2, column_subset)
 
 
 def show_non_ref_alts(scheme_dir: Path):
     """Show primer records with sequences not matching the reference sequence"""
-    bed_path = scheme_dir / "primer.bed"
-    with TemporaryDirectory() as temp_dir:
-        convert_scheme_bed_to_primer_bed(
-            bed_path=scheme_dir / "scheme.bed",
-            fasta_path=scheme_dir / "reference.fasta",
-            out_dir=temp_dir,
-        )
-        return diff(bed1_path=bed_path, bed2_path=Path(temp_dir) / "primer.bed")
+    df1 = parse_primer_bed(scheme_dir / "primer.bed").assign(origin="bed1")
+    df2 = scheme_to_primer_df(
+        bed_path=scheme_dir / "scheme.bed",
+        fasta_path=scheme_dir / "reference.fasta",
+    ).assign(origin="bed2")
+    return _diff_dfs(df1, df2, PRIMER_BED_FIELDS)
+
+
+_PRIMER_NAME_RE = re.compile(r"^(?P<name>.*)_(LEFT|RIGHT)(_.+)?$")
+_EDEN_PRIMER_NAME_RE = re.compile(r"^(?P<name>.*_[AB][0-9])(F|R)_\d+$")
 
 
 def compute_intervals(bed_path: Path) -> dict[str, dict[str, (int, int)]]:
     # find primer positions for all primers in the bed file and compute maximum
     # interval between primers of the same name
 
-    primer_name_re = re.compile(r"^(?P<name>.*)_(LEFT|RIGHT)(_.+)?$")
-    eden_primer_name_re = re.compile(r"^(?P<name>.*_[AB][0-9])(F|R)_\d+$")
     all_intervals: dict[str, dict[str, (int, int)]] = {}
     for line in open(bed_path):
         line_parts = line.strip().split("\t")
         if len(line_parts) < 6:
             # skip lines that don't have at least 6 fields
             continue
-        chrom, start, end, name, _, strand = line.strip().split("\t")[:6]
+        chrom, start, end, name, _, strand = line_parts[:6]
         if chrom not in all_intervals:
             all_intervals[chrom] = {}
         intervals = all_intervals[chrom]
-        primer_match = primer_name_re.match(name)
+        primer_match = _PRIMER_NAME_RE.match(name)
         if not primer_match:
             # the Eden scheme has a unique primer name format
-            primer_match = eden_primer_name_re.match(name)
-            if not primer_name_re:
+            primer_match = _EDEN_PRIMER_NAME_RE.match(name)
+            if not primer_match:
                 raise ValueError(f"Invalid primer name {name}")
         primer_name = primer_match.group("name")
         if strand == "+":
@@ -143,8 +143,8 @@ def test_diff():
     run_cmd = run(
         "primaschema diff primer-schemes/midnight/v1/primer.bed primer-schemes/midnight/v2/primer.bed"
     )
-    assert """chrom  chromStart  chromEnd                      name  poolName strand                 sequence origin
-MN908947.3       27784     27808 SARS-CoV-2_28_LEFT_27837T         2      + TTTGTGCTTTTTAGCCTTTCTGTT   bed2""" == run_cmd.stdout.strip()
+    assert """chrom\tchromStart\tchromEnd\tname\tpoolName\tstrand\tsequence\torigin
+MN908947.3\t27784\t27808\tSARS-CoV-2_28_LEFT_27837T\t2\t+\tTTTGTGCTTTTTAGCCTTTCTGTT\tbed2""" == run_cmd.stdout.strip()
 
 
 def test_calculate_intervals():
@@ -161,3 +161,21 @@ def test_print_intervals():
     run_cmd = run("primaschema intervals primer-schemes/artic/v4.1/primer.bed")
 
     assert """MN908947.3\t29452\t29854\tSARS-CoV-2_99\n""" in run_cmd.stdout
+
+
+def test_hash_bed_cache_invalidation(tmp_path):
+    bed_text = (data_dir / "primer-schemes/artic/v4.1/primer.bed").read_text()
+    bed_path = tmp_path / "primer.bed"
+    bed_path.write_text(bed_text)
+    original_checksum = lib.hash_bed(bed_path)
+    lines = bed_text.splitlines(keepends=True)
+    bed_path.write_text("".join(lines[:-1]))
+    assert lib.hash_bed(bed_path) != original_checksum
+
+
+def test_parse_yaml_cache_invalidation(tmp_path):
+    info_path = tmp_path / "info.yml"
+    info_path.write_text("name: artic-v4.1\n")
+    assert lib.parse_yaml(info_path)["name"] == "artic-v4.1"
+    info_path.write_text("name: artic-v4.1-modified\n")
+    assert lib.parse_yaml(info_path)["name"] == "artic-v4.1-modified"